@@ -1,9 +1,13 @@
 import csv
+import hashlib
+import json
 import requests
+from requests.adapters import HTTPAdapter
 import feedparser
 import os
 import time
 from datetime import datetime, timezone, timedelta
+from operator import itemgetter
 
 # --- Configuration ---
 RSS_URL = "https://www.austrac.gov.au/media-release/rss.xml"
@@ -12,6 +16,15 @@ ARTICLES_CSV = "articles.csv"
 SOURCE_NAME = "austrac.gov.au"
 CSV_HEADERS = ['date', 'source', 'url', 'title', 'done']
 REQUEST_TIMEOUT = 30
+USER_AGENT = 'Python RSS Collector Script/1.0'
+FEED_CACHE_JSON = "austrac.etag.json" # ETag/Last-Modified from the previous fetch, keyed by feed URL
+NOT_MODIFIED = object() # Returned by fetch_and_parse_feed when the server answers 304
+FETCH_FAILED = object() # Passed by run_all.py when its fetch failed: skip the run instead of fetching again
+
+# One session per process so repeated fetches reuse the TCP/TLS connection
+SESSION = requests.Session()
+SESSION.headers['User-Agent'] = USER_AGENT
+SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=32))
 
 # --- Functions ---
 
@@ -23,10 +36,9 @@ def load_keywords(filename):
         return keywords
     try:
         with open(filename, mode='r', encoding='utf-8-sig') as infile: # utf-8-sig for potential BOM
-            for line in infile:
-                keyword = line.strip().lower()
-                if keyword: # Ensure keyword is not empty
-                    keywords.add(keyword)
+            data = infile.read().lower() # File is small; lowercase it in one pass
+        keywords = {line.strip() for line in data.splitlines()}
+        keywords.discard('') # Blank lines
         print(f"Loaded {len(keywords)} unique keywords/phrases from {filename}.")
     except FileNotFoundError:
          print(f"Error: Keywords file '{filename}' not found.") # Should be caught by os.path.exists
@@ -38,14 +50,7 @@ def load_existing_urls(filename, source_filter):
     """Loads existing article URLs for a specific source from the articles CSV file."""
     existing_urls = set()
     if not os.path.exists(filename) or os.path.getsize(filename) == 0:
-        try:
-            with open(filename, mode='w', newline='', encoding='utf-8') as outfile: # Create if not exists
-                writer = csv.writer(outfile)
-                writer.writerow(CSV_HEADERS)
-            print(f"Created or initialized articles file '{filename}' with headers.")
-        except IOError as e:
-            print(f"Error: Could not create/initialize articles file '{filename}': {e}")
-        return existing_urls
+        return existing_urls # Header is written by the append step in main()
 
     try:
         with open(filename, mode='r', newline='', encoding='utf-8') as infile:
@@ -63,15 +68,64 @@ def load_existing_urls(filename, source_filter):
     print(f"Found {len(existing_urls)} existing URLs for source '{source_filter}' in {filename}")
     return existing_urls
 
-def fetch_and_parse_feed(url, timeout):
-    """Fetches and parses the RSS feed."""
+def load_feed_cache(filename, url):
+    """Loads the ETag/Last-Modified values stored for a feed URL on the previous run."""
+    if not os.path.exists(filename):
+        return {}
+    try:
+        with open(filename, mode='r', encoding='utf-8') as infile:
+            return json.load(infile).get(url, {})
+    except (IOError, ValueError) as e:
+        print(f"Warning: Could not read feed cache '{filename}': {e}")
+        return {}
+
+def feed_state(keywords, source_rows):
+    """
+    Describes what a cached feed version was processed against: the keyword set and the number
+    of this source's rows in the CSV. A 304 is only trusted while both are unchanged.
+    """
+    keywords_sha1 = hashlib.sha1('\n'.join(sorted(keywords)).encode('utf-8')).hexdigest()
+    return {'keywords_sha1': keywords_sha1, 'source_rows': source_rows}
+
+def save_feed_cache(filename, url, feed, state):
+    """Stores the feed's ETag/Last-Modified (and feed_state) so the next run can send a conditional GET."""
+    try:
+        cache = {}
+        if os.path.exists(filename):
+            with open(filename, mode='r', encoding='utf-8') as infile:
+                cache = json.load(infile)
+        cache[url] = {'etag': feed.get('etag'), 'modified': feed.get('modified'), 'state': state}
+        with open(filename, mode='w', encoding='utf-8') as outfile:
+            json.dump(cache, outfile, indent=2)
+    except (IOError, ValueError) as e:
+        print(f"Warning: Could not update feed cache '{filename}': {e}")
+
+def fetch_and_parse_feed(url, timeout, session=None, conditional=True):
+    """
+    Fetches and parses the RSS feed, using a conditional GET unless `conditional` is False.
+    Returns NOT_MODIFIED if the feed is unchanged since the previous run.
+    A multi-source runner may pass its own requests.Session; SESSION is used otherwise.
+    """
     print(f"Fetching RSS feed from: {url}")
-    headers = {'User-Agent': 'Python RSS Collector Script/1.0'}
+    session = session or SESSION
+    headers = {'User-Agent': USER_AGENT}
+    cached = load_feed_cache(FEED_CACHE_JSON, url) if conditional else {}
+    if cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+    if cached.get('modified'):
+        headers['If-Modified-Since'] = cached['modified']
     try:
-        response = requests.get(url, timeout=timeout, headers=headers)
+        response = session.get(url, timeout=timeout, headers=headers)
+        if response.status_code == 304:
+            print("Feed not modified since the previous run.")
+            return NOT_MODIFIED
         response.raise_for_status()
         content = response.content # Use content for feedparser
         feed = feedparser.parse(content)
+        # Keep the validators on the feed (as feedparser does for URLs it fetches itself)
+        # so main() can persist them once the entries have been handled.
+        feed['etag'] = response.headers.get('ETag')
+        feed['modified'] = response.headers.get('Last-Modified')
         if feed.bozo:
             print(f"Warning: Feed may be ill-formed. Parser issue: {feed.bozo_exception}")
         if not feed.entries:
@@ -92,10 +146,7 @@ def check_match(entry, keywords):
     title = entry.get('title', '').lower()
     summary = entry.get('summary', entry.get('description', '')).lower()
     content_to_check = title + " " + summary
-    for keyword in keywords:
-        if keyword in content_to_check:
-            return True
-    return False
+    return any(keyword in content_to_check for keyword in keywords)
 
 def format_date_to_iso_utc(parsed_date_tuple):
     """
@@ -122,19 +173,41 @@ def format_date_to_iso_utc(parsed_date_tuple):
         return None
 
 
-def main():
+def main(feed=None):
+    """Runs the collector. `feed` may be pre-fetched by run_all.py; otherwise it is fetched here."""
     print("--- Starting AUSTRAC RSS Collector (Date Format UTC) ---")
     keywords = load_keywords(KEYWORDS_TXT)
     if not keywords:
         print("No keywords loaded. Exiting.")
         return
 
+    if feed is FETCH_FAILED:
+        print("Feed fetch failed in run_all.py. Skipping this run.")
+        return
     existing_urls = load_existing_urls(ARTICLES_CSV, SOURCE_NAME)
-    feed = fetch_and_parse_feed(RSS_URL, REQUEST_TIMEOUT)
+    # A 304 only means the feed is unchanged: if the keywords or this source's rows in the CSV
+    # changed since the cached version was processed (edited keywords, reset CSV), re-read it in full
+    state = feed_state(keywords, len(existing_urls))
+    conditional = load_feed_cache(FEED_CACHE_JSON, RSS_URL).get('state') == state
+    if feed is None:
+        feed = fetch_and_parse_feed(RSS_URL, REQUEST_TIMEOUT, conditional=conditional)
+    elif feed is NOT_MODIFIED and not conditional:
+        print("Keywords or CSV changed since the cached feed version. Fetching the full feed.")
+        feed = fetch_and_parse_feed(RSS_URL, REQUEST_TIMEOUT, conditional=False)
+    if feed is NOT_MODIFIED:
+        print("No changes in the RSS feed. Nothing to do.")
+        return
     if not feed:
         print("Failed to fetch/parse RSS feed. Exiting.")
         return
 
+    # Common steady-state case: every entry is already in the CSV, so skip matching/date work
+    entry_urls = {entry.get('link', '').strip() for entry in feed.entries}
+    if entry_urls and entry_urls <= existing_urls:
+        print("No new entries in the feed. Nothing to do.")
+        save_feed_cache(FEED_CACHE_JSON, RSS_URL, feed, state)
+        return
+
     new_articles = []
     processed_count = 0
     MIN_YEAR = 2025
@@ -172,43 +245,38 @@ def main():
                  print(f"Warning: Skipping matched article due to date formatting error. URL: <{url}>")
                  continue
 
-            # For sorting, convert the ISO string back to a datetime object (aware)
-            # This ensures sorting works correctly with full timestamps.
-            try:
-                sort_dt_utc = datetime.fromisoformat(iso_date_utc_str)
-            except ValueError:
-                print(f"Warning: Could not parse ISO date '{iso_date_utc_str}' for sorting. Skipping article '{title}'.")
-                continue
-
-
             article_data = {
                 'date': iso_date_utc_str, # YYYY-MM-DDTHH:MM:SS+00:00
                 'source': SOURCE_NAME,
                 'url': url,
                 'title': title,
-                'done': '',
-                '_sort_date_obj': sort_dt_utc # Use datetime object for sorting
+                'done': ''
             }
             new_articles.append(article_data)
 
     print(f"Finished processing {processed_count} entries. Found {len(new_articles)} new matching articles.")
 
     if new_articles:
-        new_articles.sort(key=lambda x: x['_sort_date_obj']) # Sort by datetime object
+        new_articles.sort(key=itemgetter('date')) # Fixed-offset ISO 8601 strings sort chronologically
         print(f"Appending {len(new_articles)} new articles to '{ARTICLES_CSV}'...")
         try:
             with open(ARTICLES_CSV, mode='a', newline='', encoding='utf-8') as outfile:
                 writer = csv.DictWriter(outfile, fieldnames=CSV_HEADERS, extrasaction='ignore')
-                # Header is written by load_existing_urls if file is new/empty
+                if outfile.tell() == 0: # New or empty file
+                    writer.writeheader()
                 for article in new_articles:
-                    writer.writerow({k: article[k] for k in CSV_HEADERS}) # Write only specified headers
+                    writer.writerow(article)
             print(f"Successfully appended {len(new_articles)} new articles.")
         except IOError as e:
             print(f"Error: Could not write new articles to '{ARTICLES_CSV}': {e}")
+            return
         except Exception as e:
             print(f"Error: Unexpected error while writing to CSV: {e}")
+            return
     else:
         print("No new matching articles to add.")
+    # Only remember the feed version once its entries are safely in the CSV
+    save_feed_cache(FEED_CACHE_JSON, RSS_URL, feed, feed_state(keywords, len(existing_urls) + len(new_articles)))
     print("--- AUSTRAC RSS Collector Finished ---")
 
 if __name__ == "__main__":
@@ -1,13 +1,36 @@
 import csv
+import io
+import json
 import os
+import time
 from datetime import datetime, timezone # Added timezone
-import feedparser
+from operator import itemgetter
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_tz, mktime_tz
+import requests
+from lxml import etree
 
 # Constants
 RSS_URL = 'https://australiandefiassociation.substack.com/feed'
 CSV_FILE = 'articles.csv'
 SOURCE = 'australiandefiassociation.substack.com'
 CSV_HEADERS = ['date', 'source', 'url', 'title', 'done'] # Define headers
+FEED_CACHE_JSON = 'australiandefiassociation.etag.json' # ETag/Last-Modified from the previous fetch
+NOT_MODIFIED = object() # Returned by fetch_feed when the server answers 304
+FETCH_FAILED = object() # Passed by run_all.py when its fetch failed: skip the run instead of fetching again
+REQUEST_TIMEOUT = 30 # seconds
+USER_AGENT = 'Python RSS Collector Script/1.0'
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+
+# One feed item; published_parsed is a UTC time.struct_time (or None), like feedparser's field
+FeedEntry = namedtuple('FeedEntry', ['link', 'title', 'published_parsed'])
+
+# Tolerant parser for real-world feeds; never resolves entities or touches the network
+XML_PARSER = etree.XMLParser(recover=True, resolve_entities=False, no_network=True)
+
+SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': USER_AGENT})
 
 def load_existing_urls():
     """Load existing URLs for our source from the CSV."""
@@ -24,62 +47,206 @@ def load_existing_urls():
         return urls
 
     try:
-        with open(CSV_FILE, newline='', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            if not reader.fieldnames or not all(h in reader.fieldnames for h in ['url', 'source']):
+        with open(CSV_FILE, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            if 'url' not in header or 'source' not in header:
                 print(f"Warning: CSV file '{CSV_FILE}' is missing 'url' or 'source' headers.")
                 return urls # Cannot reliably read
-            for row in reader:
-                if row.get('source') == SOURCE and row.get('url'):
-                    urls.add(row.get('url'))
+            url_idx, src_idx = header.index('url'), header.index('source')
+            min_len = max(url_idx, src_idx) + 1
+            urls = {row[url_idx] for row in reader
+                    if len(row) >= min_len and row[src_idx] == SOURCE and row[url_idx]}
     except Exception as e:
         print(f"Error loading existing URLs from '{CSV_FILE}': {e}")
     return urls
 
 
-def append_articles_to_csv(entries_to_append):
+def append_articles_to_csv(rows_to_append):
     """
-    Append new entries to the CSV.
-    Date format: YYYY-MM-DDTHH:MM:SS+00:00 (UTC).
+    Append new rows to the CSV.
+    Each row is a tuple in CSV_HEADERS order; date format: YYYY-MM-DDTHH:MM:SS+00:00 (UTC).
     """
-    # File existence and header are handled by load_existing_urls or initial creation
-    # We open in append mode.
+    # The header is normally written by load_existing_urls; it is added here if the file is still empty
     try:
-        with open(CSV_FILE, 'a', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=CSV_HEADERS)
-            for entry_data in entries_to_append: # Expecting a list of dicts
-                writer.writerow(entry_data)
-        print(f"Successfully appended {len(entries_to_append)} new articles to '{CSV_FILE}'.")
+        # Build all rows in memory and append them with one os.write on an O_APPEND fd:
+        # no text-layer overhead, and the append cannot interleave with another scraper's
+        fd = os.open(CSV_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o644)
+        try:
+            buf = io.StringIO()
+            writer = csv.writer(buf)
+            if os.fstat(fd).st_size == 0:
+                writer.writerow(CSV_HEADERS)
+            writer.writerows(rows_to_append)
+            data = memoryview(buf.getvalue().encode('utf-8'))
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+        print(f"Successfully appended {len(rows_to_append)} new articles to '{CSV_FILE}'.")
+        return True
     except IOError as e:
         print(f"Error appending articles to '{CSV_FILE}': {e}")
+        return False
+
+
+def load_feed_cache():
+    """Load the ETag/Last-Modified values stored for RSS_URL on the previous run."""
+    if not os.path.exists(FEED_CACHE_JSON):
+        return {}
+    try:
+        with open(FEED_CACHE_JSON, encoding='utf-8') as f:
+            return json.load(f).get(RSS_URL, {})
+    except (IOError, ValueError) as e:
+        print(f"Warning: Could not read feed cache '{FEED_CACHE_JSON}': {e}")
+        return {}
+
+
+def save_feed_cache(feed):
+    """Store the feed's ETag/Last-Modified so the next run can send a conditional GET."""
+    try:
+        cache = {}
+        if os.path.exists(FEED_CACHE_JSON):
+            with open(FEED_CACHE_JSON, encoding='utf-8') as f:
+                cache = json.load(f)
+        cache[RSS_URL] = {'etag': feed.get('etag'), 'modified': feed.get('modified')}
+        with open(FEED_CACHE_JSON, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2)
+    except (IOError, ValueError) as e:
+        print(f"Warning: Could not update feed cache '{FEED_CACHE_JSON}': {e}")
+
+
+def rss_date_to_utc_tuple(value):
+    """RFC 822 pubDate -> UTC time.struct_time, or None if it cannot be parsed."""
+    parsed = parsedate_tz(value) if value else None
+    if not parsed:
+        return None
+    if parsed[9] is None: # No zone given: treat as UTC (mktime_tz would use local time)
+        parsed = parsed[:9] + (0,)
+    try:
+        return time.gmtime(mktime_tz(parsed))
+    except (OverflowError, ValueError):
+        return None
+
+
+def atom_date_to_utc_tuple(value):
+    """ISO 8601 published/updated -> UTC time.struct_time, or None if it cannot be parsed."""
+    try:
+        dt = datetime.fromisoformat(value.strip())
+    except (AttributeError, ValueError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.utctimetuple()
 
 
-def main():
+def parse_feed_entries(content):
+    """
+    Extract (link, title, published_parsed) from RSS 2.0 <item>s, or Atom <entry>s
+    if the document has no items. Entries without a link are dropped.
+    """
+    root = etree.fromstring(content, XML_PARSER)
+    if root is None:
+        return []
+    entries = []
+    items = root.findall('./channel/item')
+    if items:
+        for item in items:
+            link = (item.findtext('link') or '').strip()
+            if link:
+                entries.append(FeedEntry(link, item.findtext('title'),
+                                         rss_date_to_utc_tuple(item.findtext('pubDate'))))
+        return entries
+
+    for item in root.iter(ATOM_NS + 'entry'):
+        link_tag = item.find(ATOM_NS + 'link[@rel="alternate"]')
+        if link_tag is None:
+            link_tag = item.find(ATOM_NS + 'link')
+        link = (link_tag.get('href') or '').strip() if link_tag is not None else ''
+        if link:
+            published = item.findtext(ATOM_NS + 'published') or item.findtext(ATOM_NS + 'updated')
+            entries.append(FeedEntry(link, item.findtext(ATOM_NS + 'title'), atom_date_to_utc_tuple(published)))
+    return entries
+
+
+def fetch_feed(session=None, conditional=True):
+    """
+    Fetch the Substack RSS feed (a conditional GET unless `conditional` is False) and parse the fields we use.
+    Returns NOT_MODIFIED if the feed is unchanged since the previous run, otherwise
+    {'entries': [FeedEntry, ...], 'etag': ..., 'modified': ...} (no entries on error).
+    `session` lets run_all.py share its connection pool.
+    """
+    print(f"Fetching RSS feed from: {RSS_URL}")
+    cached = load_feed_cache() if conditional else {}
+    headers = {}
+    if cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+    if cached.get('modified'):
+        headers['If-Modified-Since'] = cached['modified']
+
+    feed = {'entries': [], 'etag': None, 'modified': None}
+    try:
+        response = (session or SESSION).get(RSS_URL, headers=headers, timeout=REQUEST_TIMEOUT)
+        if response.status_code == 304:
+            print("Feed not modified since the previous run.")
+            return NOT_MODIFIED
+        response.raise_for_status()
+        # lxml reads the encoding from the XML declaration, so hand it the raw bytes
+        feed['entries'] = parse_feed_entries(response.content)
+        feed['etag'] = response.headers.get('ETag')
+        feed['modified'] = response.headers.get('Last-Modified')
+    except requests.exceptions.RequestException as e:
+        print(f"Error fetching RSS feed {RSS_URL}: {e}")
+    except etree.XMLSyntaxError as e:
+        print(f"Error parsing RSS feed {RSS_URL}: {e}")
+    return feed
+
+
+def main(feed=None):
+    """Run the scraper. `feed` may be pre-fetched by run_all.py; otherwise it is fetched here."""
     print("--- Starting Australian DeFi Association Scraper (Date Format UTC) ---")
-    feed = feedparser.parse(RSS_URL)
-    if not feed.entries:
+    if feed is FETCH_FAILED:
+        print("Feed fetch failed in run_all.py. Skipping this run.")
+        return
+    # Read the archive on a worker thread while the feed downloads (disk and network overlap)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        urls_future = executor.submit(load_existing_urls)
+        if feed is None:
+            feed = fetch_feed()
+        existing_urls = urls_future.result()
+
+    if feed is NOT_MODIFIED and not existing_urls:
+        # The cached ETag belongs to a CSV that had this source's articles; with none left
+        # (new or reset articles.csv) a 304 would skip them all, so fetch the full feed
+        print(f"No rows for {SOURCE} in '{CSV_FILE}'. Fetching the full feed.")
+        feed = fetch_feed(conditional=False)
+    if feed is NOT_MODIFIED:
+        print("No changes in the RSS feed. Nothing to do.")
+        return
+    if not feed['entries']:
         print("⚠️ No entries found in feed.")
         return
 
-    existing_urls = load_existing_urls()
-    new_articles_for_csv = []
     MIN_YEAR = 2025
 
-    # Process entries (feedparser usually provides them newest first, so iterate normally or reverse if needed for chronological add)
+    # Process entries (the feed usually lists them newest first, so iterate normally or reverse if needed for chronological add)
     # To add them chronologically (oldest first to CSV), we can collect and then sort.
     
     collected_entries = []
-    for entry in feed.entries:
+    for entry in feed['entries']:
         if entry.link in existing_urls:
             continue
 
-        # Parse date from feedparser's structured time tuple (assumed UTC by feedparser)
+        # Parse date from the entry's structured UTC time tuple
         dt_obj_utc = None
-        if entry.get('published_parsed'):
+        pp = entry.published_parsed
+        if pp:
+            # Decide the year filter on the raw tuple so old entries never build a datetime
+            if pp[0] < MIN_YEAR:
+                continue
             # Create datetime object from tuple: (year, month, day, hour, minute, second, ...)
             # and make it timezone-aware UTC
             try:
-                pp = entry.published_parsed
                 dt_obj_utc = datetime(pp[0], pp[1], pp[2], pp[3], pp[4], pp[5], tzinfo=timezone.utc)
             except (TypeError, IndexError, ValueError) as e:
                 print(f"Warning: Could not parse 'published_parsed' for {entry.link}: {e}. Using current UTC time as fallback.")
@@ -93,34 +260,30 @@ def main():
             # print(f"Debug: Skipping article from {dt_obj_utc.year}: {entry.title}")
             continue
         
-        # Format to YYYY-MM-DDTHH:MM:SS+00:00
-        iso_date_utc = dt_obj_utc.strftime('%Y-%m-%dT%H:%M:%S+00:00')
-
-        collected_entries.append({
-            'date': iso_date_utc,
-            'source': SOURCE,
-            'url': entry.link,
-            'title': entry.title.strip() if entry.title else "No Title",
-            'done': '',
-            '_sort_date_obj': dt_obj_utc # For sorting
-        })
+        # Format to YYYY-MM-DDTHH:MM:SS+00:00 (tzinfo is UTC, so isoformat() matches without strftime)
+        iso_date_utc = dt_obj_utc.replace(microsecond=0).isoformat()
+
+        # CSV row in CSV_HEADERS order
+        collected_entries.append(
+            (iso_date_utc, SOURCE, entry.link, entry.title.strip() if entry.title else "No Title", '')
+        )
 
     if not collected_entries:
         print("No new articles from 2025 onwards to add.")
+        save_feed_cache(feed)
         return
 
-    # Sort new entries by date (oldest first)
-    collected_entries.sort(key=lambda x: x['_sort_date_obj'])
+    # Sort new entries by date (oldest first); all dates share the same UTC ISO 8601
+    # format, so comparing the strings orders them chronologically
+    collected_entries.sort(key=itemgetter(0))
 
-    # Prepare for CSV by removing the temporary sort key
-    for item in collected_entries:
-        del item['_sort_date_obj']
-        
-    append_articles_to_csv(collected_entries)
+    if append_articles_to_csv(collected_entries):
+        # Only remember the feed version once its entries are safely in the CSV
+        save_feed_cache(feed)
 
     # Output added URLs (optional)
-    # for entry_dict in collected_entries:
-    #     print(f"Added: {entry_dict['url']}")
+    # for row in collected_entries:
+    #     print(f"Added: {row[2]}")
     print("--- Australian DeFi Association Scraper Finished ---")
 
 if __name__ == '__main__':
@@ -6,12 +6,16 @@ Dates are parsed and stored in ISO 8601 UTC format: YYYY-MM-DDTHH:MM:SS+00:00.
 
 import requests
 from bs4 import BeautifulSoup
+from lxml import etree, html
 import os
 import csv
+import io
 import re
 import datetime # Standard datetime
-from dateutil import parser as dateparser
 from datetime import timezone # Import timezone
+from functools import lru_cache
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 
 # — Configuration —
 FEED_URL = 'https://australianfintech.com.au/newsfeed-page/'
@@ -19,6 +23,29 @@ CSV_FILE = 'articles.csv'
 TOP_N = 10 # How many latest links to check from the feed page
 SOURCE = 'australianfintech.com.au'
 CSV_HEADERS = ['date', 'source', 'url', 'title', 'done']
+MAX_WORKERS = 8 # Article pages fetched concurrently
+
+# "Month DD, YYYY" fallback when an article has no <time datetime>; a str pattern, so \s also
+# matches the non-breaking spaces (&nbsp;) WordPress puts in dates
+# This regex is an example, might need refinement for australianfintech.com.au
+MONTH_DAY_YEAR_RE = re.compile(
+    r'(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+\d{4}'
+)
+
+# Elements that usually hold a WordPress post's visible date
+DATE_META_SELECTOR = '.entry-meta, .posted-on, .meta-date, time'
+
+# "Read more" anchors (case-insensitive) with an href, in document order; evaluated by lxml in C
+READ_MORE_HREFS_XPATH = etree.XPath(
+    "//a[@href][contains(translate(string(.), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'read more')]/@href"
+)
+
+# One keep-alive session for the feed page and all article pages (shared by worker threads)
+SESSION = requests.Session()
+SESSION.headers.update({
+    'Accept-Encoding': 'gzip, deflate',
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36',
+})
 
 def ensure_csv_header():
     """Create CSV file with header if it doesn't yet exist or is empty."""
@@ -35,35 +62,60 @@ def load_seen_urls():
         return seen # No file or empty file, no seen URLs
 
     try:
-        with open(CSV_FILE, 'r', encoding='utf-8', newline='') as f:
-            reader = csv.DictReader(f)
-            if not reader.fieldnames or not all(h in reader.fieldnames for h in ['url', 'source']):
+        with open(CSV_FILE, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            if 'url' not in header or 'source' not in header:
                 print(f"Warning: CSV file '{CSV_FILE}' is missing 'url' or 'source' headers.")
                 return seen
-            for row in reader:
-                if row.get('source') == SOURCE and row.get('url'):
-                    seen.add(row['url'])
+            url_idx, src_idx = header.index('url'), header.index('source')
+            min_len = max(url_idx, src_idx) + 1
+            seen = {row[url_idx] for row in reader
+                    if len(row) >= min_len and row[src_idx] == SOURCE and row[url_idx]}
     except Exception as e:
         print(f"Error loading seen URLs from '{CSV_FILE}': {e}")
     return seen
 
 
+@lru_cache(maxsize=4096)
+def parse_iso_datetime(value):
+    """
+    Parse an ISO 8601 timestamp such as a <time datetime="..."> attribute.
+    Tries the C-implemented fromisoformat first, then explicit strptime formats.
+    Raises ValueError if none match.
+    """
+    value = value.strip()
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    for fmt in ('%Y-%m-%dT%H:%M:%S%z', '%Y-%m-%dT%H:%M:%SZ'):
+        try:
+            return datetime.datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    raise ValueError(f"Unrecognised ISO 8601 timestamp: {value!r}")
+
+
+@lru_cache(maxsize=4096)
+def parse_month_day_year(value):
+    """Parse a 'Month DD, YYYY' date string (naive datetime). Raises ValueError on mismatch."""
+    return datetime.datetime.strptime(' '.join(value.split()), '%B %d, %Y')
+
+
 def fetch_latest_links():
     """Scrape the feed page for the first TOP_N article hrefs."""
     links = []
     try:
-        resp = requests.get(FEED_URL, timeout=30)
+        resp = SESSION.get(FEED_URL, timeout=30)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.content, 'html.parser')
+        tree = html.fromstring(resp.content)
         # Look for <a> tags with "Read more" text, common on this site
-        read_more_links = soup.find_all('a', string=re.compile(r'Read more', re.IGNORECASE))
-        for link_tag in read_more_links:
-            if link_tag.get('href'):
-                links.append(link_tag['href'])
-            if len(links) >= TOP_N:
-                break
+        links = [str(href) for href in READ_MORE_HREFS_XPATH(tree) if href][:TOP_N]
     except requests.exceptions.RequestException as e:
         print(f"Error fetching latest links from {FEED_URL}: {e}")
+    except etree.ParserError as e:
+        print(f"Error parsing newsfeed page {FEED_URL}: {e}")
     return links
 
 
@@ -74,9 +126,9 @@ def parse_article_date_and_title(url):
     Returns (None, "", "") on failure.
     """
     try:
-        resp = requests.get(url, timeout=30)
+        resp = SESSION.get(url, timeout=30)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.content, 'html.parser')
+        soup = BeautifulSoup(resp.content, 'lxml')
     except requests.exceptions.RequestException as e:
         print(f"Error fetching article page {url}: {e}")
         return None, "", ""
@@ -91,8 +143,7 @@ def parse_article_date_and_title(url):
     time_tag = soup.find('time', datetime=True)
     if time_tag and time_tag.get('datetime'):
         try:
-            # dateparser.parse can handle various formats and timezone info if present
-            parsed_dt = dateparser.parse(time_tag['datetime'])
+            parsed_dt = parse_iso_datetime(time_tag['datetime'])
             # Convert to UTC
             if parsed_dt.tzinfo is None: # If naive, assume local and convert (or assume UTC)
                 # For simplicity, let's assume naive dates from here are UTC if not specified
@@ -104,43 +155,58 @@ def parse_article_date_and_title(url):
             print(f"Warning: Could not parse datetime attribute '{time_tag['datetime']}' from {url}: {e}")
             date_obj_utc = None # Reset if parsing failed
 
-    # Attempt 2: Find date string in text (e.g., "Month DD, YYYY")
+    # Attempt 2: Find date string in the page (e.g., "Month DD, YYYY")
     if not date_obj_utc:
-        # Look for common date patterns in the text content
-        # This regex is an example, might need refinement for australianfintech.com.au
-        date_pattern = r'(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+\d{4}'
-        text_content = soup.get_text()
-        match = re.search(date_pattern, text_content)
+        # Look in the post-meta element first (one node), then the whole page's text; parsed
+        # text, not markup, so entities and inline tags inside the date do not break the match
+        match = None
+        meta_tag = soup.select_one(DATE_META_SELECTOR)
+        if meta_tag:
+            match = MONTH_DAY_YEAR_RE.search(meta_tag.get_text(' '))
+        if not match:
+            match = MONTH_DAY_YEAR_RE.search(soup.get_text(' '))
         if match:
+            date_text = match.group(0)
             try:
-                parsed_dt = dateparser.parse(match.group(0))
+                parsed_dt = parse_month_day_year(date_text)
                 # Assume UTC if parsed as naive
                 date_obj_utc = parsed_dt.replace(tzinfo=timezone.utc)
             except (ValueError, TypeError) as e:
-                print(f"Warning: Could not parse date string '{match.group(0)}' from text on {url}: {e}")
+                print(f"Warning: Could not parse date string '{date_text}' from text on {url}: {e}")
 
-    if date_obj_utc:
-        date_iso_utc = date_obj_utc.strftime('%Y-%m-%dT%H:%M:%S+00:00')
-    else:
+    if not date_obj_utc:
         print(f"Warning: Could not determine publication date for {url}. Using current UTC time as fallback.")
         date_obj_utc = datetime.datetime.now(timezone.utc) # Fallback to current UTC time
-        date_iso_utc = date_obj_utc.strftime('%Y-%m-%dT%H:%M:%S+00:00')
-        
+    # tzinfo is timezone.utc here, so isoformat() yields YYYY-MM-DDTHH:MM:SS+00:00 without strftime
+    date_iso_utc = date_obj_utc.replace(microsecond=0).isoformat()
+
     return date_obj_utc, date_iso_utc, title
 
 
 def append_to_csv(articles_data):
-    """Append a list of article data (dictionaries) to the CSV file."""
+    """Append a list of article data (dictionaries) to the CSV file. Returns True on success."""
     if not articles_data:
-        return
+        return False
     try:
-        with open(CSV_FILE, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=CSV_HEADERS)
-            for article_row in articles_data:
-                 writer.writerow(article_row)
+        # Build all rows in memory and append them with one os.write on an O_APPEND fd:
+        # no text-layer overhead, and the append cannot interleave with another scraper's
+        fd = os.open(CSV_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o644)
+        try:
+            buf = io.StringIO()
+            writer = csv.DictWriter(buf, fieldnames=CSV_HEADERS)
+            if os.fstat(fd).st_size == 0:
+                writer.writeheader()
+            writer.writerows(articles_data)
+            data = memoryview(buf.getvalue().encode('utf-8'))
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
         print(f"Appended {len(articles_data)} new articles to '{CSV_FILE}'.")
+        return True
     except IOError as e:
         print(f"Error writing to CSV '{CSV_FILE}': {e}")
+        return False
 
 
 def main():
@@ -157,13 +223,12 @@ def main():
     new_articles_to_add = []
     MIN_YEAR = 2025
 
-    for url in latest_links:
-        if url in seen_urls:
-            # print(f"Skipping already seen URL: {url}")
-            continue
-
-        date_obj_utc, date_iso_utc, title = parse_article_date_and_title(url)
+    # Unseen links in page order, without repeats; their pages are fetched concurrently
+    urls_to_fetch = list(dict.fromkeys(url for url in latest_links if url not in seen_urls))
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        parsed_articles = list(executor.map(parse_article_date_and_title, urls_to_fetch))
 
+    for url, (date_obj_utc, date_iso_utc, title) in zip(urls_to_fetch, parsed_articles):
         if date_obj_utc is None: # Should not happen with fallback, but defensive check
             print(f"Skipping article due to parsing failure (no date): {url}")
             continue
@@ -175,8 +240,7 @@ def main():
         
         print(f"Found new article: '{title}' ({date_iso_utc}) URL: {url}")
         new_articles_to_add.append({
-            'date_obj': date_obj_utc, # For sorting
-            'date': date_iso_utc,     # ISO string for CSV
+            'date': date_iso_utc, # ISO string for CSV, also the sort key
             'source': SOURCE,
             'url': url,
             'title': title,
@@ -188,16 +252,11 @@ def main():
         print("No new articles found to add (or all were older than 2025).")
         return
 
-    # Sort entries by date_obj (oldest first)
-    new_articles_to_add.sort(key=lambda e: e['date_obj'])
-
-    # Prepare for CSV by removing the temporary sort key
-    csv_ready_articles = []
-    for item in new_articles_to_add:
-        del item['date_obj']
-        csv_ready_articles.append(item)
+    # Sort entries by date (oldest first); all dates share the same UTC ISO 8601
+    # format, so comparing the strings orders them chronologically
+    new_articles_to_add.sort(key=itemgetter('date'))
 
-    append_to_csv(csv_ready_articles)
+    append_to_csv(new_articles_to_add)
     print("--- Australian FinTech Scraper Finished ---")
 
 if __name__ == '__main__':
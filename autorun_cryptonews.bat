@@ -9,10 +9,7 @@ echo [%date% %time%] autorun started >> "%~dp0\autorun_run.log"
 REM Run Python scripts
 python asic.py
 python ausblock.py
-python austrac.py
-python australiandefiassociation.py
-python coindesk.py
-python cointelegraph.py
+python run_all.py
 python cryptonews.py
 python decrypt.py
 python regtechglobal.py
@@ -0,0 +1,454 @@
+"""
+Headless Chrome shared by the Selenium-based scrapers.
+
+Starting Chrome (and resolving chromedriver) costs a few seconds, so the
+scrapers are handed a get_driver() function instead of starting their own
+browser. Chrome is started on its first call only, i.e. only if some page
+is not served over plain HTTP, and then shared:
+
+    with browser_session.lazy_session() as get_driver:
+        coindesk.scrape_listing(get_driver)
+        cointelegraph.scrape_articles(get_driver)
+
+get_driver() returns None if Chrome could not be started; callers treat that
+like a failed page load.
+"""
+
+import os
+import re
+import shutil
+import socket
+import subprocess
+import tempfile
+import time
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from webdriver_manager.chrome import ChromeDriverManager
+
+# --- Configuration ---
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36'
+ACCEPT_BUTTON_TIMEOUT_SECONDS = 3 # For all accept-button selectors together
+# 'eager': driver.get() returns at DOMContentLoaded instead of waiting for every
+# subresource; the scrapers wait for the article cards themselves anyway.
+PAGE_LOAD_STRATEGY = 'eager'
+# Images are never rendered (2 = block). Stylesheets are deliberately left on: the
+# clickable/visibility waits need real layout. Fonts go through BLOCKED_URL_PATTERNS.
+CHROME_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+}
+# Background subsystems a scrape never uses (extensions, sync, component updates,
+# translation, ...); switched off so they neither slow start-up nor use the network.
+CHROME_QUIET_ARGS = [
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-sync',
+    '--disable-default-apps',
+    '--disable-component-update',
+    '--metrics-recording-only',
+    '--mute-audio',
+    '--no-first-run',
+    '--disable-features=Translate,OptimizationHints,MediaRouter,AcceptCHFrame',
+]
+# Keep one headless Chrome running between runs and attach to it over its debugging
+# port, instead of launching (and closing) a browser every run. Off by default.
+PERSISTENT_CHROME = False
+DEBUGGER_ADDRESS = "127.0.0.1:9222"
+PERSISTENT_PROFILE_DIR = os.path.join(tempfile.gettempdir(), "ozcryptonews-chrome") # Profile for the long-lived Chrome
+PERSISTENT_CHROME_START_TIMEOUT_SECONDS = 15
+CHROME_BINARY_CANDIDATES = [
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+]
+DRIVER_PATH_CACHE = "chromedriver_path.txt" # chromedriver location resolved on a previous run
+DRIVER_PATH_CACHE_MAX_AGE_SECONDS = 24 * 60 * 60 # Re-check once a day when the installed Chrome version is unknown
+CHROME_VERSION_RE = re.compile(r'\d+\.\d+\.\d+\.\d+')
+# Requests Chrome never makes during a scrape: only the HTML/DOM is read, so images,
+# video, web fonts and trackers are dropped. Stylesheets stay so cookie banners and
+# card layouts (used by the clickable/scroll waits) behave as in a normal browser.
+BLOCKED_URL_PATTERNS = [
+    '*.jpg', '*.jpeg', '*.png', '*.webp', '*.gif', '*.svg', '*.avif', '*.mp4', '*.webm',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*google-analytics*', '*googletagmanager*', '*doubleclick*', '*segment.io*', '*segment.com*',
+]
+
+# Clicks the first visible cookie/consent button among arguments[0], a list of
+# [By, value] pairs (By.ID, By.XPATH and By.CSS_SELECTOR; other kinds are skipped).
+# Returns a description of the selector that matched, or null if none did.
+CLICK_ACCEPT_BUTTON_JS = """
+for (const [by, value] of arguments[0]) {
+    let el = null;
+    try {
+        if (by === 'id') el = document.getElementById(value);
+        else if (by === 'css selector') el = document.querySelector(value);
+        else if (by === 'xpath') el = document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    } catch (e) {
+        continue;
+    }
+    if (el && !el.disabled && el.getClientRects().length) {
+        el.scrollIntoView(true);
+        el.click();
+        return by + "='" + value + "'";
+    }
+}
+return null;
+"""
+
+# Counts article cards added to the page in window.__newCards, so scrolling can wait
+# for real new content instead of a fixed pause. arguments[0] is a CSS selector.
+OBSERVE_NEW_CARDS_JS = """
+const selector = arguments[0];
+window.__newCards = 0;
+if (window.__cardObserver) window.__cardObserver.disconnect();
+window.__cardObserver = new MutationObserver(mutations => {
+    for (const mutation of mutations) {
+        for (const node of mutation.addedNodes) {
+            if (node.nodeType === 1 && (node.matches(selector) || node.querySelector(selector))) {
+                window.__newCards++;
+            }
+        }
+    }
+});
+window.__cardObserver.observe(document.body, {childList: true, subtree: true});
+"""
+
+
+def get_chrome_major_version():
+    """
+    Returns the installed Chrome's major version ('120'), or None if it cannot be told
+    cheaply. On Windows chrome.exe --version opens a window instead of printing, so the
+    versioned folder next to chrome.exe is read; elsewhere --version is run.
+    """
+    chrome_binary = find_chrome_binary()
+    if not chrome_binary:
+        return None
+    try:
+        if os.name == 'nt':
+            versions = [name for name in os.listdir(os.path.dirname(chrome_binary)) if CHROME_VERSION_RE.fullmatch(name)]
+            version = max(versions, key=lambda v: tuple(map(int, v.split('.'))), default=None)
+        else:
+            output = subprocess.run([chrome_binary, '--version'], capture_output=True, text=True, timeout=10).stdout
+            match = CHROME_VERSION_RE.search(output)
+            version = match.group(0) if match else None
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return version.split('.')[0] if version else None
+
+
+def get_chromedriver_path():
+    """
+    Returns the chromedriver path: $CHROMEDRIVER if set, else the path cached on disk
+    if it was resolved for the Chrome major version installed now (or, when that version
+    can't be read, within the last DRIVER_PATH_CACHE_MAX_AGE_SECONDS). Only otherwise does
+    it run ChromeDriverManager().install(), which makes a network version check.
+    """
+    env_path = os.environ.get('CHROMEDRIVER')
+    if env_path and os.path.exists(env_path):
+        return env_path
+
+    chrome_version = get_chrome_major_version()
+    cached_path = None
+    try:
+        # Line 1: chromedriver path; line 2: Chrome major version it was resolved for
+        with open(DRIVER_PATH_CACHE, encoding='utf-8') as f:
+            cache_lines = [line.strip() for line in f.read().splitlines() if line.strip()]
+        cached_path = cache_lines[0] if cache_lines else None
+        cached_version = cache_lines[1] if len(cache_lines) > 1 else None
+        if not cached_path or not os.path.exists(cached_path):
+            cached_path = None
+        elif chrome_version and cached_version:
+            if chrome_version == cached_version:
+                return cached_path
+            print(f"Chrome updated ({cached_version} -> {chrome_version}); resolving a matching chromedriver.")
+        elif time.time() - os.path.getmtime(DRIVER_PATH_CACHE) < DRIVER_PATH_CACHE_MAX_AGE_SECONDS:
+            return cached_path
+    except OSError:
+        pass # No cache yet
+
+    try:
+        driver_path = ChromeDriverManager().install()
+    except Exception as e:
+        if not cached_path:
+            raise
+        print(f"Warning: chromedriver update check failed ({e}); using cached '{cached_path}'.")
+        return cached_path
+    try:
+        with open(DRIVER_PATH_CACHE, 'w', encoding='utf-8') as f:
+            f.write(driver_path + '\n' + (chrome_version or '') + '\n')
+    except IOError as e:
+        print(f"Warning: Could not cache chromedriver path in '{DRIVER_PATH_CACHE}': {e}")
+    return driver_path
+
+
+def find_chrome_binary():
+    """Returns the Chrome executable for PERSISTENT_CHROME: $CHROME_BINARY, else the usual install locations."""
+    env_path = os.environ.get('CHROME_BINARY')
+    if env_path and os.path.exists(env_path):
+        return env_path
+    for path in CHROME_BINARY_CANDIDATES:
+        if os.path.exists(path):
+            return path
+    for name in ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome'):
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
+
+def chrome_is_listening():
+    """True if something accepts connections on DEBUGGER_ADDRESS."""
+    host, port = DEBUGGER_ADDRESS.rsplit(':', 1)
+    try:
+        with socket.create_connection((host, int(port)), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+
+def ensure_chrome_running():
+    """
+    Starts a detached headless Chrome with a remote-debugging port unless one is
+    already listening on DEBUGGER_ADDRESS. The process outlives this run, so the
+    next run (or the next scraper) only attaches to it. Returns True if Chrome is up.
+    """
+    if chrome_is_listening():
+        return True
+    chrome_binary = find_chrome_binary()
+    if not chrome_binary:
+        print("Warning: Chrome executable not found (set CHROME_BINARY); cannot start a persistent Chrome.")
+        return False
+    port = DEBUGGER_ADDRESS.rsplit(':', 1)[1]
+    print(f"Starting persistent Chrome on {DEBUGGER_ADDRESS}...")
+    try:
+        subprocess.Popen(
+            [chrome_binary, '--headless=new', f'--remote-debugging-port={port}',
+             f'--user-data-dir={PERSISTENT_PROFILE_DIR}', '--window-size=1920,1080',
+             '--disable-gpu', '--no-sandbox', '--disable-dev-shm-usage',
+             '--blink-settings=imagesEnabled=false', f'--user-agent={USER_AGENT}',
+             '--no-default-browser-check', *CHROME_QUIET_ARGS],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            # Detach, so Chrome is not killed with this script (or its console window on Windows)
+            creationflags=getattr(subprocess, 'DETACHED_PROCESS', 0) | getattr(subprocess, 'CREATE_NEW_PROCESS_GROUP', 0),
+            start_new_session=(os.name != 'nt'),
+        )
+    except OSError as e:
+        print(f"Warning: Could not start Chrome '{chrome_binary}': {e}")
+        return False
+    deadline = time.time() + PERSISTENT_CHROME_START_TIMEOUT_SECONDS
+    while time.time() < deadline:
+        if chrome_is_listening():
+            return True
+        time.sleep(0.2)
+    print(f"Warning: Chrome did not open {DEBUGGER_ADDRESS} within {PERSISTENT_CHROME_START_TIMEOUT_SECONDS}s.")
+    return False
+
+
+def prepare_driver(driver):
+    """Per-session setup shared by a launched and an attached driver."""
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        print(f"Warning: Could not enable request blocking (continuing without it): {e}")
+    return driver
+
+
+def attach_driver():
+    """
+    Attaches a WebDriver session to the persistent Chrome (starting it if needed).
+    Returns None if that is not possible. quit() on this driver ends the session
+    but leaves Chrome running for the next run.
+    """
+    if not ensure_chrome_running():
+        return None
+    try:
+        options = webdriver.ChromeOptions()
+        options.add_experimental_option("debuggerAddress", DEBUGGER_ADDRESS)
+        options.page_load_strategy = PAGE_LOAD_STRATEGY
+        service = ChromeService(get_chromedriver_path())
+        driver = prepare_driver(webdriver.Chrome(service=service, options=options))
+        print(f"Attached to persistent Chrome on {DEBUGGER_ADDRESS}.")
+        return driver
+    except Exception as e:
+        print(f"Warning: Could not attach to Chrome on {DEBUGGER_ADDRESS}: {e}")
+        return None
+
+
+def setup_driver():
+    """
+    Returns a headless Chrome driver, or None if it could not be started.
+    With PERSISTENT_CHROME the long-lived Chrome is attached to first; a fresh
+    Chrome is launched only if that fails.
+    """
+    if PERSISTENT_CHROME:
+        driver = attach_driver()
+        if driver:
+            return driver
+        print("Falling back to launching a new Chrome for this run.")
+    print("Setting up Chrome WebDriver...")
+    try:
+        options = webdriver.ChromeOptions()
+        options.add_argument('--headless=new') # Current headless mode: same rendering as headed Chrome
+        options.add_argument('--window-size=1920,1080') # Desktop layout so the desktop card markup is served
+        options.add_argument('--disable-gpu')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--log-level=3')
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_argument(f'user-agent={USER_AGENT}')
+        for arg in CHROME_QUIET_ARGS:
+            options.add_argument(arg)
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option('useAutomationExtension', False)
+        options.add_experimental_option('prefs', CHROME_PREFS)
+        options.page_load_strategy = PAGE_LOAD_STRATEGY
+        service = ChromeService(get_chromedriver_path())
+        driver = prepare_driver(webdriver.Chrome(service=service, options=options))
+        print("WebDriver setup complete.")
+        return driver
+    except Exception as e:
+        print(f"Error setting up WebDriver: {e}")
+        return None
+
+
+@contextmanager
+def session():
+    """Yields one Chrome driver (None if setup failed) and quits it on exit."""
+    driver = setup_driver()
+    try:
+        yield driver
+    finally:
+        if driver:
+            print("Closing browser...")
+            driver.quit()
+            print("Browser closed.")
+
+
+@contextmanager
+def lazy_session():
+    """
+    Like session(), but yields a get_driver() function: Chrome is started on its first
+    call (a failed setup is not retried) and quit on exit if it was started.
+    """
+    drivers = [] # Holds the one driver (or None) once get_driver() has been called
+    def get_driver():
+        if not drivers:
+            drivers.append(setup_driver())
+        return drivers[0]
+    try:
+        yield get_driver
+    finally:
+        if drivers and drivers[0]:
+            print("Closing browser...")
+            drivers[0].quit()
+            print("Browser closed.")
+
+
+def click_accept_button(driver, selectors, timeout):
+    """
+    Attempts to find and click an "Accept Cookies" or similar button.
+    All selectors are tried in one script call per poll, so a page without a banner
+    costs one timeout in total rather than one per selector.
+    """
+    print("Checking for and attempting to click Accept button...")
+    try:
+        clicked = WebDriverWait(driver, timeout, poll_frequency=0.25).until(
+            lambda d: d.execute_script(CLICK_ACCEPT_BUTTON_JS, [list(selector) for selector in selectors])
+        )
+        print(f"Successfully clicked Accept button using selector: {clicked}")
+        time.sleep(0.5) # Let the overlay go away
+        return True
+    except TimeoutException:
+        print("Could not find or click the Accept button (or it wasn't present).")
+    except Exception as e:
+        print(f"An error occurred trying to click the Accept button: {e}")
+    return False
+
+
+def get_page_html(driver):
+    """
+    Returns the rendered document's HTML through one CDP Runtime.evaluate call,
+    which skips WebDriver's own page-source serialisation; driver.page_source is
+    the fallback if CDP is unavailable.
+    """
+    try:
+        result = driver.execute_cdp_cmd('Runtime.evaluate', {
+            'expression': 'document.documentElement.outerHTML',
+            'returnByValue': True,
+        })
+        html = result.get('result', {}).get('value')
+        if isinstance(html, str) and html:
+            return html
+    except Exception as e:
+        print(f"Warning: CDP page read failed ({e}); using driver.page_source.")
+    return driver.page_source
+
+
+def fetch_page_source_with_selenium(driver, url, wait_selector, fallback_selector, timeout,
+                                    accept_selectors, scroll_attempts, scroll_pause, read_page=None):
+    """
+    Loads url, dismisses the cookie banner, waits for article cards and scrolls up to
+    scroll_attempts times. Each scroll waits at most scroll_pause seconds for new cards
+    (counted by a MutationObserver) and scrolling stops at the first one that adds none.
+    Returns (page_source, selector_used); page_source is None on failure.
+    fallback_selector may be None. read_page(driver, selector_used), if given, replaces
+    the final HTML read and its return value is passed back instead of the page source.
+    """
+    print(f"Fetching data from: {url} using Selenium...")
+    page_source = None
+    primary_selector_used = wait_selector 
+    try:
+        driver.get(url)
+        # Observe from the start so cards loaded while the cookie banner is handled are seen too
+        observed = f"{wait_selector}, {fallback_selector}" if fallback_selector else wait_selector
+        driver.execute_script(OBSERVE_NEW_CARDS_JS, observed)
+        click_accept_button(driver, accept_selectors, ACCEPT_BUTTON_TIMEOUT_SECONDS)
+
+        print(f"Waiting up to {timeout} seconds for initial elements matching selector: '{wait_selector}'")
+        try:
+            WebDriverWait(driver, timeout).until(
+                EC.presence_of_all_elements_located((By.CSS_SELECTOR, wait_selector))
+            )
+            print(f"Initial article element(s) potentially loaded using '{wait_selector}'.")
+        except TimeoutException:
+            if fallback_selector:
+                print(f"Timeout waiting for primary selector '{wait_selector}'. Trying fallback '{fallback_selector}'...")
+                try:
+                     WebDriverWait(driver, 5).until( # Shorter wait for fallback
+                        EC.presence_of_all_elements_located((By.CSS_SELECTOR, fallback_selector))
+                     )
+                     print(f"Initial fallback element(s) potentially loaded using '{fallback_selector}'.")
+                     primary_selector_used = fallback_selector 
+                except TimeoutException:
+                     print(f"Timeout waiting for fallback selector '{fallback_selector}' as well.")
+                     print("Attempting scrolling, but extraction might fail if elements don't load.")
+            else:
+                print(f"Timeout waiting for selector '{wait_selector}' and no fallback provided. Proceeding with scroll.")
+
+        print(f"Attempting to scroll down {scroll_attempts} times...")
+        for i in range(scroll_attempts):
+            driver.execute_script("window.__newCards = 0; window.scrollTo(0, document.body.scrollHeight);")
+            # Continue as soon as new cards arrive; scroll_pause is only the upper bound.
+            # A scroll that brings no new cards means the listing is exhausted.
+            try:
+                WebDriverWait(driver, scroll_pause, poll_frequency=0.2).until(
+                    lambda d: d.execute_script("return window.__newCards > 0")
+                )
+            except TimeoutException:
+                print(f"No new articles after scroll {i + 1}; stopping.")
+                break
+        print("Scrolling finished.")
+        page_source = read_page(driver, primary_selector_used) if read_page else get_page_html(driver)
+        print("Page source retrieved.")
+    except WebDriverException as e:
+        print(f"WebDriver error during Selenium processing: {e}")
+    except Exception as e:
+        print(f"Unexpected error during Selenium fetching: {e}")
+    return page_source, primary_selector_used
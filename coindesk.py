@@ -2,18 +2,17 @@ import csv
 import os
 import time
 from datetime import datetime, timezone # Added timezone
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 from dateutil import parser as date_parser
-from selenium import webdriver
-from selenium.common.exceptions import (ElementClickInterceptedException,
-                                        NoSuchElementException,
-                                        TimeoutException, WebDriverException)
-from selenium.webdriver.chrome.service import Service as ChromeService
+from selectolax.lexbor import LexborHTMLParser
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
+
+import browser_session
 
 # --- Configuration ---
 URL = "https://www.coindesk.com/tag/australia"
@@ -21,217 +20,253 @@ CSV_FILENAME = "articles.csv"
 SOURCE_NAME = "coindesk.com"
 HEADERS = ['date', 'source', 'url', 'title', 'done']
 SELENIUM_TIMEOUT_SECONDS = 25
+HTTP_TIMEOUT_SECONDS = 15
+HTTP_MIN_ARTICLES = 5 # Fewer server-rendered cards than this means the page needs the browser
+HTTP_LISTING_PAGES = 3 # Tag pages fetched in parallel when the listing is server-rendered (page 1 included)
+LISTING_PAGE_URL = URL + "/{page}" # Pages 2..HTTP_LISTING_PAGES of the tag listing
+USE_BROWSER_FALLBACK = True # False: never start Chrome; a listing that is not server-rendered yields nothing
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36'
 SCROLL_PAUSE_TIME = 2
 SCROLL_ATTEMPTS = 5
-ACCEPT_BUTTON_TIMEOUT_SECONDS = 10
+SHOW_APPEND_PREVIEW = False # Print a per-article preview before appending (debugging aid)
+CSV_BUFFER_SIZE = 256 * 1024 # One read()/write() syscall per 256 KiB of articles.csv instead of per 8 KiB
+MIN_PAGE_SOURCE_LENGTH = 1024 # Anything shorter is an error/blank page, not a listing; not worth parsing
+DEBUG_HTML_FILE = "debug_coindesk_page.html" # Written when a page yields no article elements
+FETCH_FAILED = object() # Passed by run_all.py when scrape_listing raised: skip the run instead of scraping again
 
 ARTICLE_CONTAINER_SELECTOR = 'div.bg-white.flex.gap-6.w-full.shrink.justify-between'
 ARTICLE_CONTAINER_SELECTOR_FALLBACK = 'div.flex.flex-col.gap-4'
+# Lookups inside one article card, shared by extract_articles and EXTRACT_CARDS_JS
+CARD_LINK_SELECTOR = 'a[class*="text-color-charcoal-900"][href]'
+CARD_DATE_CONTAINER_SELECTOR = 'p.flex.gap-2.flex-col'
+CARD_DATE_SPAN_SELECTOR = 'span.font-metadata.text-color-charcoal-600'
+CARD_TIME_SELECTOR = 'time[datetime]' # Fallback date source: its datetime attribute
+CARD_TITLE_SELECTOR = 'h2' # Inside the link; the link text is used if absent
+# Shapes of the card's date text ("May 1, 2025"); anything else (e.g. "3 hours ago") goes to dateutil
+SPAN_DATE_FORMATS = ('%b %d, %Y', '%B %d, %Y')
 ACCEPT_BUTTON_SELECTORS = [
     (By.ID, "onetrust-accept-btn-handler"),
     (By.XPATH, "//button[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'accept')]"),
     (By.CSS_SELECTOR, 'button[data-testid*="accept"], button[aria-label*="Accept"]')
 ]
 
+# Runs extract_articles' card lookups in the browser and returns only
+# [href, title, date_str, date_is_iso] per card, instead of shipping the whole page back.
+# Text is built like selectolax's text(strip=True): each text node stripped, then joined.
+# arguments[0] / arguments[1]: container selector and its fallback; arguments[2..5]: the
+# CARD_* link, date span (within its container), time and title selectors.
+EXTRACT_CARDS_JS = """
+const text = node => {
+    const walker = document.createTreeWalker(node, NodeFilter.SHOW_TEXT);
+    let out = '';
+    while (walker.nextNode()) out += walker.currentNode.nodeValue.trim();
+    return out;
+};
+let elements = document.querySelectorAll(arguments[0]);
+if (!elements.length && arguments[1]) elements = document.querySelectorAll(arguments[1]);
+const cards = [];
+for (const el of elements) {
+    const link = el.querySelector(arguments[2]);
+    if (!link || !link.getAttribute('href')) continue;
+    const title = text(link.querySelector(arguments[5]) || link);
+    const span = el.querySelector(arguments[3]);
+    let date = span ? text(span) : '';
+    let isIso = false;
+    if (!date) {
+        const time = el.querySelector(arguments[4]);
+        if (time && time.getAttribute('datetime')) {
+            date = time.getAttribute('datetime');
+            isIso = true;
+        }
+    }
+    if (date) cards.push([link.getAttribute('href'), title, date, isIso]);
+}
+return cards;
+"""
+
 # --- Helper Functions ---
 
-def load_existing_urls(filename, source_filter):
+def open_csv(filename, headers_list):
+    """
+    Opens the CSV once for the whole run, for reading and appending ('a+': every write
+    goes to the end). Writes the header row if the file is new or empty.
+    """
+    csvfile = open(filename, 'a+', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE)
+    if os.fstat(csvfile.fileno()).st_size == 0:
+        csv.writer(csvfile).writerow(headers_list)
+        csvfile.flush()
+        print(f"Initialized CSV file '{filename}' with headers.")
+    return csvfile
+
+def load_existing_urls(csvfile, source_filter):
+    """Returns the URLs already stored for source_filter, reading the open CSV from the start."""
     existing_urls = set()
-    if not os.path.exists(filename) or os.path.getsize(filename) == 0:
-        try:
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile_init:
-                writer = csv.DictWriter(csvfile_init, fieldnames=HEADERS)
-                writer.writeheader()
-            print(f"Initialized CSV file '{filename}' with headers.")
-        except IOError as e:
-            print(f"Error initializing CSV file '{filename}': {e}")
-        return existing_urls
-        
     try:
-        with open(filename, 'r', newline='', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            if not reader.fieldnames or not all(header in reader.fieldnames for header in ['url', 'source']):
-                print(f"Warning: CSV file '{filename}' is missing required columns. Cannot load existing URLs.")
-                return existing_urls
-            for row in reader:
-                if row and row.get('source') == source_filter and row.get('url'):
-                    existing_urls.add(row['url'])
-        print(f"Loaded {len(existing_urls)} existing URLs for source '{source_filter}' from '{filename}'.")
+        csvfile.seek(0)
+        reader = csv.reader(csvfile)
+        header = next(reader, [])
+        if 'url' not in header or 'source' not in header:
+            print(f"Warning: CSV file '{csvfile.name}' is missing required columns. Cannot load existing URLs.")
+            return existing_urls
+        # Column indices instead of a dict per row; one set comprehension over the file.
+        # Every record is parsed (titles may hold quoted newlines) and filtered on its source column.
+        url_idx, src_idx = header.index('url'), header.index('source')
+        min_len = max(url_idx, src_idx) + 1
+        existing_urls = {row[url_idx] for row in reader
+                         if len(row) >= min_len and row[src_idx] == source_filter and row[url_idx]}
+        print(f"Loaded {len(existing_urls)} existing URLs for source '{source_filter}' from '{csvfile.name}'.")
     except Exception as e:
-        print(f"Error reading CSV file '{filename}': {e}. Check file encoding and format.")
+        print(f"Error reading CSV file '{csvfile.name}': {e}. Check file encoding and format.")
     return existing_urls
 
-def setup_driver():
-    print("Setting up Chrome WebDriver...")
-    try:
-        options = webdriver.ChromeOptions()
-        options.add_argument('--headless')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--log-level=3')
-        options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36')
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-        service = ChromeService(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        print("WebDriver setup complete.")
-        return driver
-    except Exception as e:
-        print(f"Error setting up WebDriver: {e}")
+@lru_cache(maxsize=4096)
+def parse_date_fixed(date_str, is_iso):
+    """
+    The memoized part of parse_date_utc (a page repeats the same dates): only the results
+    that do not depend on the current time. Returns an aware UTC datetime for an ISO value
+    fromisoformat accepts, a date for span text matching SPAN_DATE_FORMATS, otherwise None.
+    """
+    if not is_iso:
+        for date_format in SPAN_DATE_FORMATS:
+            try:
+                return datetime.strptime(date_str, date_format).date()
+            except ValueError:
+                continue
         return None
+    try:
+        parsed_dt_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+    except ValueError:
+        return None # Not strict ISO 8601 after all; let dateutil try
+    if parsed_dt_obj.tzinfo is None: # If naive
+        return parsed_dt_obj.replace(tzinfo=timezone.utc) # Assume UTC
+    return parsed_dt_obj.astimezone(timezone.utc)
 
-def click_accept_button(driver, selectors, timeout):
-    # (No changes needed in this function for date formatting)
-    print("Checking for and attempting to click Accept button...")
-    button_clicked = False
-    for by, selector_value in selectors:
-        try:
-            accept_button = WebDriverWait(driver, timeout).until(
-                EC.element_to_be_clickable((by, selector_value))
-            )
-            driver.execute_script("arguments[0].scrollIntoView(true);", accept_button)
-            time.sleep(0.5) # Brief pause after scroll
-            accept_button.click()
-            print(f"Successfully clicked Accept button using selector: {by}='{selector_value}'")
-            time.sleep(1) # Wait for overlay to disappear
-            button_clicked = True
-            break 
-        except TimeoutException:
-            continue
-        except ElementClickInterceptedException:
-             print(f"Accept button click intercepted for {by}='{selector_value}'. Trying JS click.")
-             try:
-                 # Re-find element before JS click to ensure it's the same one
-                 intercepted_button = driver.find_element(by, selector_value)
-                 driver.execute_script("arguments[0].click();", intercepted_button)
-                 print(f"Successfully clicked Accept button using JavaScript fallback.")
-                 time.sleep(1)
-                 button_clicked = True
-                 break
-             except Exception as js_e:
-                 print(f"JavaScript click also failed for {by}='{selector_value}': {js_e}")
-                 continue
-        except Exception as e:
-            print(f"An error occurred trying to click Accept button with {by}='{selector_value}': {e}")
-            continue
-    if not button_clicked:
-        print("Could not find or click the Accept button (or it wasn't present).")
-    return button_clicked
-
+def parse_date_utc(date_str, is_iso=False):
+    """
+    Parses a listing date string into an aware UTC datetime. is_iso marks values from
+    <time datetime>, which go through the C fromisoformat ('Z' normalised for Pythons
+    before 3.11). The human-readable span text is tried against SPAN_DATE_FORMATS with
+    strptime, then dateutil; either way missing fields (the time of day) are taken from
+    the current UTC time. Only the parsed ISO datetime / span date is cached (parse_date_fixed).
+    Naive results are assumed to be UTC.
+    Raises ValueError/OverflowError/TypeError on unparseable input.
+    """
+    fixed = parse_date_fixed(date_str, is_iso)
+    if isinstance(fixed, datetime): # Checked first: a datetime is also a date
+        return fixed
+    if fixed is not None:
+        # Same result as dateutil with default=now: the date from the text, the rest from now
+        return datetime.now(timezone.utc).replace(year=fixed.year, month=fixed.month, day=fixed.day)
+    # FIX: Add default=datetime.now(timezone.utc) for relative date parsing
+    parsed_dt_obj = date_parser.parse(date_str, default=datetime.now(timezone.utc))
+    if parsed_dt_obj.tzinfo is None: # If naive
+        return parsed_dt_obj.replace(tzinfo=timezone.utc) # Assume UTC
+    return parsed_dt_obj.astimezone(timezone.utc)
 
-def fetch_page_source_with_selenium(driver, url, wait_selector, fallback_selector, timeout):
-    # (No changes needed in this function for date formatting)
-    print(f"Fetching data from: {url} using Selenium...")
-    page_source = None
-    primary_selector_used = wait_selector 
-    try:
-        driver.get(url)
-        click_accept_button(driver, ACCEPT_BUTTON_SELECTORS, ACCEPT_BUTTON_TIMEOUT_SECONDS)
 
-        print(f"Waiting up to {timeout} seconds for initial elements matching selector: '{wait_selector}'")
-        try:
-            WebDriverWait(driver, timeout).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, wait_selector))
-            )
-            print(f"Initial article element(s) potentially loaded using '{wait_selector}'.")
-        except TimeoutException:
-            print(f"Timeout waiting for primary selector '{wait_selector}'. Trying fallback '{fallback_selector}'...")
-            try:
-                 WebDriverWait(driver, 5).until( # Shorter wait for fallback
-                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, fallback_selector))
-                 )
-                 print(f"Initial fallback element(s) potentially loaded using '{fallback_selector}'.")
-                 primary_selector_used = fallback_selector 
-            except TimeoutException:
-                 print(f"Timeout waiting for fallback selector '{fallback_selector}' as well.")
-                 print("Attempting scrolling, but extraction might fail if elements don't load.")
-
-        print(f"Attempting to scroll down {SCROLL_ATTEMPTS} times...")
-        last_height = driver.execute_script("return document.body.scrollHeight")
-        for i in range(SCROLL_ATTEMPTS):
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(SCROLL_PAUSE_TIME)
-            new_height = driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
-                break
-            last_height = new_height
-        time.sleep(2) # Final pause after scrolling
-        print("Scrolling finished.")
-        page_source = driver.page_source
-        print("Page source retrieved.")
-    except WebDriverException as e:
-        print(f"WebDriver error during Selenium processing: {e}")
-    except Exception as e:
-        print(f"Unexpected error during Selenium fetching: {e}")
-    return page_source, primary_selector_used
+def year_from_date_str(date_str, is_iso):
+    """
+    Returns the UTC year a card date string is certain to parse to, read straight off
+    the string ("2024-..." or "..., 2024"), or None if it can't be told without parsing.
+    An ISO date on Dec 31 returns None: its UTC offset may carry it into the next year.
+    """
+    if is_iso:
+        if date_str[:4].isdigit() and date_str[5:10] != '12-31':
+            return int(date_str[:4])
+    elif date_str[-4:].isdigit() and not date_str[-5:-4].isdigit():
+        return int(date_str[-4:])
+    return None
 
 
-def extract_articles(page_source, effective_selector, fallback_selector, base_url="https://www.coindesk.com"):
+def extract_articles(page_source, effective_selector, fallback_selector, base_url="https://www.coindesk.com",
+                     skip_urls=None, min_year=0):
+    """
+    Yields the new articles on a listing page as dicts (url, title, ts_utc: epoch seconds, UTC).
+    Cards whose URL is in skip_urls are skipped before their date is parsed, and cards
+    older than min_year are dropped; accepted URLs are added to skip_urls.
+    """
+    if skip_urls is None:
+        skip_urls = set()
     if not page_source:
         print("No page source provided to extract_articles.")
-        return []
-    articles = []
-    soup = BeautifulSoup(page_source, 'html.parser')
-    article_elements = soup.select(effective_selector)
+        return
+    if len(page_source) < MIN_PAGE_SOURCE_LENGTH:
+        print(f"Page source is only {len(page_source)} characters (failed load?); skipping extraction.")
+        return
+    tree = LexborHTMLParser(page_source)
+    article_elements = tree.css(effective_selector)
     print(f"Attempting extraction with selector '{effective_selector}'. Found {len(article_elements)} elements.")
 
-    if not article_elements:
+    # The fetch already falls back when the primary selector times out; don't repeat the same select
+    if not article_elements and fallback_selector != effective_selector:
         print(f"No articles with '{effective_selector}'. Trying fallback '{fallback_selector}'...")
-        article_elements = soup.select(fallback_selector)
+        article_elements = tree.css(fallback_selector)
         print(f"Found {len(article_elements)} elements with fallback selector.")
-        if not article_elements:
-            # Save debug HTML if still no articles
-            # ... (debug save logic as before)
-            return []
+    if not article_elements:
+        # Save debug HTML if still no articles: the raw source as received, no re-serialising
+        try:
+            with open(DEBUG_HTML_FILE, 'w', encoding='utf-8') as f_debug:
+                f_debug.write(page_source)
+            print(f"Saved page source to '{DEBUG_HTML_FILE}' for debugging.")
+        except IOError as e:
+            print(f"Could not save debug HTML to '{DEBUG_HTML_FILE}': {e}")
+        return
 
     extracted_count = 0
+    skipped_known = skipped_old = 0
     for element in article_elements:
         try:
-            link_tag = element.select_one('a[class*="text-color-charcoal-900"][href]')
-            date_container = element.select_one('p.flex.gap-2.flex-col') # More specific
+            link_tag = element.css_first(CARD_LINK_SELECTOR)
+            relative_url = link_tag.attributes.get('href') if link_tag else None
+            if not relative_url:
+                continue
+            full_url = base_url + relative_url if relative_url.startswith('/') else relative_url
+            if full_url in skip_urls: # Known or already taken: no date/title work for it
+                skipped_known += 1
+                continue
+
+            date_container = element.css_first(CARD_DATE_CONTAINER_SELECTOR)
             date_str = None
+            date_is_iso = False
             if date_container:
-                date_span = date_container.select_one('span.font-metadata.text-color-charcoal-600') # More specific
+                date_span = date_container.css_first(CARD_DATE_SPAN_SELECTOR)
                 if date_span:
-                    date_str = date_span.get_text(strip=True)
+                    date_str = date_span.text(strip=True)
             
             # Fallback for date if specific span not found, try <time> tag within element
             if not date_str:
-                time_tag_fallback = element.select_one('time[datetime]')
-                if time_tag_fallback and time_tag_fallback.get('datetime'):
-                    date_str = time_tag_fallback['datetime'] # Use the datetime attribute value
+                time_tag_fallback = element.css_first(CARD_TIME_SELECTOR)
+                if time_tag_fallback and time_tag_fallback.attributes.get('datetime'):
+                    date_str = time_tag_fallback.attributes['datetime'] # Use the datetime attribute value
+                    date_is_iso = True
             
-            if link_tag and link_tag.get('href') and date_str:
-                relative_url = link_tag['href']
-                full_url = base_url + relative_url if relative_url.startswith('/') else relative_url
-                
-                title_tag_h2 = link_tag.select_one('h2') # Prefer h2 if present
-                title = title_tag_h2.get_text(strip=True) if title_tag_h2 else link_tag.get_text(strip=True)
+            if date_str:
+                listed_year = year_from_date_str(date_str, date_is_iso)
+                if listed_year is not None and listed_year < min_year: # Old card: no title or date parsing
+                    skipped_old += 1
+                    continue
+                title_tag_h2 = link_tag.css_first(CARD_TITLE_SELECTOR) # Prefer h2 if present
+                title = title_tag_h2.text(strip=True) if title_tag_h2 else link_tag.text(strip=True)
 
                 if not full_url or not title: continue
 
                 try:
-                    # Parse date string. date_parser.parse is good at handling various formats.
-                    # FIX: Add default=datetime.now(timezone.utc) for relative date parsing
-                    parsed_dt_obj = date_parser.parse(date_str, default=datetime.now(timezone.utc))
-                    # Convert to UTC
-                    if parsed_dt_obj.tzinfo is None: # If naive
-                        dt_utc = parsed_dt_obj.replace(tzinfo=timezone.utc) # Assume UTC
-                    else:
-                        dt_utc = parsed_dt_obj.astimezone(timezone.utc)
-                    
-                    articles.append({
-                        'url': full_url,
-                        'title': title,
-                        'parsed_date_utc': dt_utc # Store UTC datetime object
-                    })
-                    extracted_count += 1
+                    dt_utc = parse_date_utc(date_str, date_is_iso)
                 except (ValueError, date_parser.ParserError, OverflowError, TypeError) as e:
                     print(f"Warning: Could not parse date: '{date_str}' for '{title}'. Error: {e}")
+                    continue
+                if dt_utc.year < min_year:
+                    skipped_old += 1
+                    continue
+                skip_urls.add(full_url) # A card repeated on the page (or a later page) is taken once
+                extracted_count += 1
+                yield {
+                    'url': full_url,
+                    'title': title,
+                    'ts_utc': int(dt_utc.timestamp()) # Epoch seconds: cheap to sort; the CSV keeps whole seconds anyway
+                }
             # else:
-                # print(f"Debug: Skipping element - missing link_tag or date_str. Link: {link_tag is not None}, Date: {date_str}")
+                # print(f"Debug: Skipping element - missing date_str. Date: {date_str}")
 
 
         except AttributeError as e:
@@ -239,105 +274,250 @@ def extract_articles(page_source, effective_selector, fallback_selector, base_ur
         except Exception as e:
             print(f"Error processing an article element: {e}")
     
-    print(f"Successfully extracted details for {extracted_count} articles from {len(article_elements)} potential elements.")
-    return articles
+    print(f"Successfully extracted details for {extracted_count} articles from {len(article_elements)} potential elements "
+          f"(skipped {skipped_known} already known, {skipped_old} older than {min_year}).")
+
+
+def articles_from_cards(cards, base_url="https://www.coindesk.com", skip_urls=None, min_year=0):
+    """
+    Same as extract_articles, for cards already read in the browser
+    ([href, title, date_str, date_is_iso] lists from EXTRACT_CARDS_JS).
+    """
+    if skip_urls is None:
+        skip_urls = set()
+    if not cards:
+        return
+    extracted_count = skipped_known = skipped_old = 0
+    for relative_url, title, date_str, date_is_iso in cards:
+        full_url = base_url + relative_url if relative_url.startswith('/') else relative_url
+        if full_url in skip_urls:
+            skipped_known += 1
+            continue
+        if not title:
+            continue
+        listed_year = year_from_date_str(date_str, date_is_iso)
+        if listed_year is not None and listed_year < min_year:
+            skipped_old += 1
+            continue
+        try:
+            dt_utc = parse_date_utc(date_str, date_is_iso)
+        except (ValueError, date_parser.ParserError, OverflowError, TypeError) as e:
+            print(f"Warning: Could not parse date: '{date_str}' for '{title}'. Error: {e}")
+            continue
+        if dt_utc.year < min_year:
+            skipped_old += 1
+            continue
+        skip_urls.add(full_url)
+        extracted_count += 1
+        yield {'url': full_url, 'title': title, 'ts_utc': int(dt_utc.timestamp())}
 
+    print(f"Successfully extracted details for {extracted_count} articles from {len(cards)} browser cards "
+          f"(skipped {skipped_known} already known, {skipped_old} older than {min_year}).")
 
-def append_to_csv(filename, articles_data, headers_list, source_name_val):
-    file_exists = os.path.exists(filename)
-    is_empty_or_new = not file_exists or os.path.getsize(filename) == 0
 
+def append_to_csv(csvfile, articles_data, source_name_val):
+    """Appends articles to the CSV opened by open_csv (which has already written the header)."""
     valid_articles_for_csv = []
     for article in articles_data:
-        if article.get('parsed_date_utc') and isinstance(article['parsed_date_utc'], datetime):
+        if isinstance(article.get('ts_utc'), int):
             valid_articles_for_csv.append(article)
     
     if not valid_articles_for_csv:
         print("No valid new articles with dates to append.")
         return
 
-    valid_articles_for_csv.sort(key=lambda x: x['parsed_date_utc']) # Sort by datetime object
+    valid_articles_for_csv.sort(key=itemgetter('ts_utc')) # Plain int comparisons
 
     print(f"--- Articles to be appended for {source_name_val} (Sorted Chronologically) ---")
-    # for article in valid_articles_for_csv:
-    #     print(f"- {article['parsed_date_utc'].strftime('%Y-%m-%d')}: {article['title'][:60]}...")
-    # print("-------------------------------------------------------")
+    if SHOW_APPEND_PREVIEW:
+        # Built as one string so the whole preview is a single write to stdout
+        print('\n'.join(f"- {time.strftime('%Y-%m-%d', time.gmtime(article['ts_utc']))}: {article['title'][:60]}..."
+                        for article in valid_articles_for_csv)
+              + "\n-------------------------------------------------------")
 
     try:
-        with open(filename, 'a', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=headers_list)
-            if is_empty_or_new:
-                writer.writeheader()
-                print(f"Wrote header to '{filename}'.")
-            
-            appended_count = 0
-            for article in valid_articles_for_csv:
-                iso_date_utc_str = article['parsed_date_utc'].strftime('%Y-%m-%dT%H:%M:%S+00:00')
-                row = {
-                    'date': iso_date_utc_str,
-                    'source': source_name_val,
-                    'url': article['url'],
-                    'title': article['title'],
-                    'done': ''
-                }
-                writer.writerow(row)
-                appended_count += 1
-            print(f"Appended {appended_count} new articles for '{source_name_val}' to '{filename}'.")
+        # Plain tuples in header order (date, source, url, title, done), written in one call
+        csv.writer(csvfile).writerows(
+            (time.strftime('%Y-%m-%dT%H:%M:%S+00:00', time.gmtime(article['ts_utc'])),
+             source_name_val, article['url'], article['title'], '')
+            for article in valid_articles_for_csv
+        )
+        csvfile.flush()
+        print(f"Appended {len(valid_articles_for_csv)} new articles for '{source_name_val}' to '{csvfile.name}'.")
     except IOError as e:
-        print(f"Error writing to CSV '{filename}': {e}")
+        print(f"Error writing to CSV '{csvfile.name}': {e}")
     except Exception as e:
         print(f"Unexpected error during CSV writing for '{source_name_val}': {e}")
 
 
-# --- Main Execution ---
-if __name__ == "__main__":
-    print("--- Starting CoinDesk Scraper (Date Format UTC) ---")
-    driver = None
+def make_http_session():
+    """
+    One keep-alive session for all listing-page GETs, so pages 2..N reuse the
+    connection (and TLS handshake) opened for page 1.
+    """
+    session = requests.Session()
+    session.headers['User-Agent'] = USER_AGENT
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, HTTP_LISTING_PAGES))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def fetch_page_source_http(session, url, wait_selector, fallback_selector, timeout):
+    """
+    Fetches the tag page with a plain GET (no browser).
+    Returns (page_source, selector) if at least HTTP_MIN_ARTICLES article cards are already
+    in the server-rendered HTML, otherwise (None, wait_selector) so the caller uses Selenium.
+    Only containers holding a card link (CARD_LINK_SELECTOR) count: the fallback selector's
+    generic layout classes also match plain layout divs.
+    """
+    print(f"Fetching data from: {url} over plain HTTP...")
+    try:
+        response = session.get(url, timeout=timeout)
+        response.raise_for_status()
+        tree = LexborHTMLParser(response.text)
+        for selector in (wait_selector, fallback_selector):
+            card_count = sum(1 for node in tree.css(selector) if node.css_first(CARD_LINK_SELECTOR))
+            if card_count >= HTTP_MIN_ARTICLES:
+                print(f"Found {card_count} server-rendered articles with '{selector}'; skipping the browser.")
+                return response.text, selector
+        print("Too few articles in the server-rendered page; falling back to Selenium.")
+    except requests.exceptions.RequestException as e:
+        print(f"Plain HTTP fetch failed ({e}); falling back to Selenium.")
+    return None, wait_selector
+
+
+def fetch_more_listing_pages(session, timeout):
+    """
+    Fetches listing pages 2..HTTP_LISTING_PAGES concurrently over plain HTTP, replacing
+    the browser's scrolling. Returns the page sources that loaded; failed pages are skipped.
+    """
+    page_urls = [LISTING_PAGE_URL.format(page=page) for page in range(2, HTTP_LISTING_PAGES + 1)]
+    if not page_urls:
+        return []
+
+    def fetch(page_url):
+        try:
+            response = session.get(page_url, timeout=timeout)
+            response.raise_for_status()
+            return response.text
+        except requests.exceptions.RequestException as e:
+            print(f"Skipping listing page {page_url}: {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=len(page_urls)) as executor:
+        return [page for page in executor.map(fetch, page_urls) if page]
+
+
+def scrape_listing(get_driver=None):
+    """
+    Loads the tag listing and returns (page_sources, effective_selector, browser_cards):
+    over plain HTTP (first HTTP_LISTING_PAGES pages, in parallel) when the cards are
+    server-rendered, otherwise from the scrolled page in Chrome (unless USE_BROWSER_FALLBACK
+    is False), where the cards are read in the browser (see read_cards_in_browser).
+    get_driver returns a shared browser (see browser_session.lazy_session()) and is only
+    called if the browser is needed; that browser is left open for the caller.
+    page_sources is empty if the browser could not be started or the page not loaded.
+    Runs no CSV work, so run_all.py can call it alongside other sources' fetches.
+    """
+    with make_http_session() as session:
+        page_source, effective_selector = fetch_page_source_http(
+            session, URL, ARTICLE_CONTAINER_SELECTOR, ARTICLE_CONTAINER_SELECTOR_FALLBACK, HTTP_TIMEOUT_SECONDS
+        )
+        if page_source:
+            return [page_source] + fetch_more_listing_pages(session, HTTP_TIMEOUT_SECONDS), effective_selector, []
+
+    if not USE_BROWSER_FALLBACK:
+        print("Browser fallback disabled (USE_BROWSER_FALLBACK = False); no listing pages loaded.")
+        return [], effective_selector, []
+
+    if get_driver is None:
+        with browser_session.session() as own_driver:
+            return scrape_listing_with_driver(own_driver)
+    return scrape_listing_with_driver(get_driver())
+
+
+def read_cards_in_browser(driver, effective_selector):
+    """
+    Page reader for browser_session.fetch_page_source_with_selenium: returns the
+    cards as [href, title, date_str, date_is_iso] lists found by EXTRACT_CARDS_JS.
+    If that finds nothing (or fails), returns the page HTML instead so
+    extract_articles can retry and save it for debugging.
+    """
+    try:
+        cards = driver.execute_script(
+            EXTRACT_CARDS_JS, effective_selector, ARTICLE_CONTAINER_SELECTOR_FALLBACK, CARD_LINK_SELECTOR,
+            f"{CARD_DATE_CONTAINER_SELECTOR} {CARD_DATE_SPAN_SELECTOR}", CARD_TIME_SELECTOR, CARD_TITLE_SELECTOR
+        )
+        if cards:
+            print(f"Extracted {len(cards)} article cards in the browser.")
+            return cards
+        print("No article cards found in the browser; reading the full page instead.")
+    except Exception as e:
+        print(f"In-browser extraction failed ({e}); reading the full page instead.")
+    return browser_session.get_page_html(driver)
+
+
+def scrape_listing_with_driver(driver):
+    """Selenium half of scrape_listing: the scrolled tag page from an open driver."""
     try:
-        driver = setup_driver()
         if not driver:
             raise Exception("WebDriver setup failed.")
-
-        existing_urls = load_existing_urls(CSV_FILENAME, SOURCE_NAME)
-        page_source, effective_selector_used = fetch_page_source_with_selenium(
-            driver, URL, ARTICLE_CONTAINER_SELECTOR, 
-            ARTICLE_CONTAINER_SELECTOR_FALLBACK, SELENIUM_TIMEOUT_SECONDS
+        page, effective_selector = browser_session.fetch_page_source_with_selenium(
+            driver, URL, ARTICLE_CONTAINER_SELECTOR, ARTICLE_CONTAINER_SELECTOR_FALLBACK,
+            SELENIUM_TIMEOUT_SECONDS, ACCEPT_BUTTON_SELECTORS, SCROLL_ATTEMPTS, SCROLL_PAUSE_TIME,
+            read_page=read_cards_in_browser
         )
+        if isinstance(page, list): # Cards already extracted in the browser
+            return [], effective_selector, page
+        return ([page] if page else []), effective_selector, []
+    except Exception as e:
+        print(f"An error occurred while scraping the listing page: {e}")
+        return [], ARTICLE_CONTAINER_SELECTOR, []
 
-        if page_source:
-            all_extracted = extract_articles(
-                page_source, effective_selector_used, 
-                ARTICLE_CONTAINER_SELECTOR_FALLBACK # Pass fallback again for the function's own retry
-            )
-            
-            new_articles_to_process = []
-            duplicate_count = 0
-            MIN_YEAR = 2025
-
-            for article_data in all_extracted:
-                if article_data.get('url') and article_data.get('parsed_date_utc'):
-                    if article_data['url'] not in existing_urls:
-                        if article_data['parsed_date_utc'].year >= MIN_YEAR:
-                            new_articles_to_process.append(article_data)
-                        # else:
-                            # print(f"Skipping article from {article_data['parsed_date_utc'].year}: {article_data['url']}")
-                    else:
-                        duplicate_count += 1
-            
-            print(f"Found {len(new_articles_to_process)} new articles (>= {MIN_YEAR}) to add (filtered out {duplicate_count} existing/old).")
 
-            if new_articles_to_process:
-                append_to_csv(CSV_FILENAME, new_articles_to_process, HEADERS, SOURCE_NAME)
+def main(listing=None):
+    """Run the scraper. `listing` may be pre-fetched by run_all.py (see scrape_listing); otherwise it is fetched here."""
+    print("--- Starting CoinDesk Scraper (Date Format UTC) ---")
+    if listing is FETCH_FAILED:
+        print("Listing scrape failed in run_all.py. Skipping this run.")
+        return
+    try:
+        if listing is None:
+            listing = scrape_listing()
+        page_sources, effective_selector_used, browser_cards = listing
+
+        # One open of the CSV for the run: the same handle serves the URL load and the append
+        with open_csv(CSV_FILENAME, HEADERS) as csvfile:
+            existing_urls = load_existing_urls(csvfile, SOURCE_NAME)
+
+            if page_sources or browser_cards:
+                MIN_YEAR = 2025
+                # Dedup and the year filter happen inside extract_articles, in the same pass
+                # Both extractors are generators: the only list built is this one, which append_to_csv sorts
+                new_articles_to_process = list(chain(
+                    articles_from_cards(browser_cards, skip_urls=existing_urls, min_year=MIN_YEAR),
+                    *(extract_articles(
+                        page_source, effective_selector_used, 
+                        ARTICLE_CONTAINER_SELECTOR_FALLBACK, # Pass fallback again for the function's own retry
+                        skip_urls=existing_urls, min_year=MIN_YEAR
+                    ) for page_source in page_sources)
+                ))
+                
+                print(f"Found {len(new_articles_to_process)} new articles (>= {MIN_YEAR}) to add.")
+
+                if new_articles_to_process:
+                    append_to_csv(csvfile, new_articles_to_process, SOURCE_NAME)
+                else:
+                    print("No new valid articles found to add.")
             else:
-                print("No new valid articles found to add.")
-        else:
-            print("Could not retrieve page source. Exiting.")
+                print("Could not retrieve page source. Exiting.")
 
     except Exception as e:
         print(f"An error occurred in the main execution: {e}")
-    finally:
-        if driver:
-            print("Closing browser...")
-            driver.quit()
-            print("Browser closed.")
-    print("--- CoinDesk Scraper Finished ---")
\ No newline at end of file
+    print("--- CoinDesk Scraper Finished ---")
+
+
+# --- Main Execution ---
+if __name__ == "__main__":
+    main()
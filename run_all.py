@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Runs the RSS-based collectors and the CoinDesk/CoinTelegraph scrapers with their downloads overlapped.
+
+Each collector normally fetches its source and then filters/writes it, one
+script after another, so total time is the sum of every source's latency.
+Here all feeds and the browser-based pages are fetched concurrently
+first (the two browser scrapers one after the other in a single worker,
+sharing one Chrome that is only started if a page needs it), then each collector's
+usual filter/write logic runs in turn so articles.csv is only ever written
+by one collector at a time.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import austrac
+import browser_session
+import australiandefiassociation
+import coindesk
+import cointelegraph
+
+# --- Configuration ---
+MAX_WORKERS = 16
+POOL_SIZE = 32
+
+
+def make_session():
+    """Creates a requests.Session whose connection pool is shared by all fetches."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def fetch_many(fetchers):
+    """
+    Runs the given (fetch, failed) pairs in a thread pool: `fetch` is a zero-argument callable,
+    `failed` the value used in place of its result if it raises (the collector's FETCH_FAILED,
+    which makes it skip the run rather than fetch again). Returns the results in the same order.
+    """
+    if not fetchers:
+        return []
+    results = []
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(fetchers))) as executor:
+        futures = [(executor.submit(fetcher), failed) for fetcher, failed in fetchers]
+        for future, failed in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                print(f"Error: Feed fetch failed in worker thread: {e}")
+                results.append(failed)
+    return results
+
+
+def scrape_browser_sources():
+    """
+    Runs the CoinDesk and CoinTelegraph scrapers one after the other with one shared Chrome,
+    started only when the first page that is not served over plain HTTP needs it, so Chrome
+    is set up at most once and two setups never race on chromedriver or the persistent Chrome.
+    Returns (coindesk listing, cointelegraph articles); a scraper that raises yields its FETCH_FAILED.
+    """
+    results = []
+    with browser_session.lazy_session() as get_driver:
+        for scrape, failed in ((coindesk.scrape_listing, coindesk.FETCH_FAILED),
+                               (cointelegraph.scrape_articles, cointelegraph.FETCH_FAILED)):
+            try:
+                results.append(scrape(get_driver))
+            except Exception as e:
+                print(f"Error: Browser scrape failed: {e}")
+                results.append(failed)
+    return tuple(results)
+
+
+def main():
+    print("--- Starting collectors ---")
+    session = make_session()
+    # The browser scrapers share one worker thread and run in turn (see scrape_browser_sources)
+    # while the feeds download. fetch_and_parse_feed returns None on its own errors, which is
+    # mapped to FETCH_FAILED too so austrac.main does not fetch the feed a second time
+    austrac_feed, defi_feed, (coindesk_listing, cointelegraph_articles) = fetch_many([
+        (lambda: austrac.fetch_and_parse_feed(austrac.RSS_URL, austrac.REQUEST_TIMEOUT, session=session)
+         or austrac.FETCH_FAILED, austrac.FETCH_FAILED),
+        (lambda: australiandefiassociation.fetch_feed(session=session), australiandefiassociation.FETCH_FAILED),
+        (scrape_browser_sources, (coindesk.FETCH_FAILED, cointelegraph.FETCH_FAILED)),
+    ])
+    session.close()
+
+    # Each collector runs in its own try/except, as separate processes did before, so one
+    # collector's failure does not stop the others
+    collectors = [
+        ("AUSTRAC", lambda: austrac.main(feed=austrac_feed)),
+        ("DeFi Association", lambda: australiandefiassociation.main(feed=defi_feed)),
+        ("CoinDesk", lambda: coindesk.main(listing=coindesk_listing)),
+        ("CoinTelegraph", lambda: cointelegraph.main(scraped=cointelegraph_articles)),
+    ]
+    for name, run_collector in collectors:
+        try:
+            run_collector()
+        except Exception as e:
+            print(f"Error: {name} collector failed: {e}")
+    print("--- Collectors finished ---")
+
+
+if __name__ == '__main__':
+    main()